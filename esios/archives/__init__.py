@@ -1,26 +1,45 @@
 import pandas as pd
 import zipfile
 import os
-from io import BytesIO
-import requests
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 class Archives:
+    # Seconds a selected archive's metadata is reused before it is fetched again
+    metadata_ttl = 3600
+
     def __init__(self, client):
         self.client = client
+        self._metadata = {}
+        self._catalog = None
 
     def list(self):
-        endpoint = "archives"
-        data = self.client._get(endpoint, self.client.public_headers)
-        return pd.DataFrame(data.get('archives', []))
+        # The archive catalog is static, so build it once and hand out copies
+        if self._catalog is None:
+            endpoint = "archives"
+            data = self.client._get(endpoint, self.client.public_headers)
+            self._catalog = pd.DataFrame(data.get('archives', []))
+        
+        return self._catalog.copy()
 
     def select(self, id):
-        return Archive(self.client, id)
+        # Archive metadata rarely changes, so reuse it per id until it expires
+        fetched_at, metadata = self._metadata.get(id, (None, None))
+        if fetched_at is not None and time.monotonic() - fetched_at < self.metadata_ttl:
+            return Archive(self.client, id, metadata=metadata)
+        
+        archive = Archive(self.client, id)
+        self._metadata[id] = (time.monotonic(), archive.metadata)
+        return archive
 
 class Archive:
-    def __init__(self, client, id):
+    def __init__(self, client, id, metadata=None):
         self.client = client
         self.id = id
-        self.metadata = self._get_metadata()
+        self.metadata = metadata if metadata is not None else self._get_metadata()
 
     def _get_metadata(self):
         endpoint = f"archives/{self.id}"
@@ -72,29 +91,84 @@ class Archive:
             The path to the extracted file.
         """
         
-        response = requests.get(self.url_download)
-        response.raise_for_status()
-        
-        zip_file = BytesIO(response.content)
-        
-        output_dir = os.path.join(output_dir, self.name)
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Extract the main ZIP file
-        self._extract_zip(zip_file, output_dir)
+        # Stream the download to a temporary file so large archives are never held in memory
+        # (TemporaryFile rather than SpooledTemporaryFile, which is not seekable before Python 3.11)
+        with self.client.session.get(self.url_download, stream=True) as response:
+            response.raise_for_status()
+            
+            with tempfile.TemporaryFile() as zip_file:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    zip_file.write(chunk)
+                zip_file.seek(0)
+                
+                # Only create the output directory once the whole body has arrived
+                output_dir = os.path.join(output_dir, self.name)
+                os.makedirs(output_dir, exist_ok=True)
+                
+                # Extract the main ZIP file
+                self._extract_zip(zip_file, output_dir)
 
-    def _extract_zip(self, file, directory):
+    def _extract_zip(self, file, directory, slots=None):
         """
         Extracts a ZIP file to the specified directory. If there are nested ZIP files,
         they are extracted recursively.
         """
-        with zipfile.ZipFile(file) as z:
-            z.extractall(directory)
-            for member in z.namelist():
-                member_path = os.path.join(directory, member)
-                if zipfile.is_zipfile(member_path):
-                    nested_dir = os.path.splitext(member_path)[0]
+        # One set of slots is shared by the whole recursion, so at most 8 nested ZIPs
+        # are spooled and waiting on the pools at any time, however deep they are nested
+        if slots is None:
+            slots = threading.BoundedSemaphore(8)
+        
+        with zipfile.ZipFile(file) as z, ThreadPoolExecutor(max_workers=4) as executor:
+            # ZipFile handles are not safe for concurrent reads, so nested ZIPs are spooled
+            # here and only their extraction runs on the pool
+            futures = []
+            
+            for info in z.infolist():
+                # Nested archives are recognised by their .zip suffix; sniffing contents with
+                # is_zipfile would also unpack .xlsx workbooks, which are ZIP containers too
+                if info.filename.lower().endswith('.zip'):
+                    nested_dir = os.path.splitext(self._member_path(directory, info.filename))[0]
                     os.makedirs(nested_dir, exist_ok=True)
-                    with open(member_path, 'rb') as nested_file:
-                        self._extract_zip(nested_file, nested_dir)
-                    os.remove(member_path)  # Remove the nested ZIP file after extraction
+                    
+                    # Copy the nested ZIP to its own seekable temporary file so it can be opened
+                    # independently of the parent, and never lands in the output directory
+                    nested_file = tempfile.TemporaryFile()
+                    submitted = False
+                    try:
+                        with z.open(info) as member:
+                            shutil.copyfileobj(member, nested_file, 1024 * 1024)
+                        nested_file.seek(0)
+                        
+                        # Hand it to the pool while a slot is free, otherwise extract it here;
+                        # never blocking on a slot keeps nested levels from deadlocking
+                        if slots.acquire(blocking=False):
+                            try:
+                                futures.append(executor.submit(self._extract_nested_zip, nested_file, nested_dir, slots))
+                                submitted = True
+                            except BaseException:
+                                slots.release()
+                                raise
+                        else:
+                            self._extract_zip(nested_file, nested_dir, slots)
+                    finally:
+                        if not submitted:
+                            nested_file.close()
+                else:
+                    z.extract(info, directory)
+            
+            for future in futures:
+                future.result()
+
+    def _member_path(self, directory, name):
+        # Sanitize the member name the way ZipFile.extract does, so a nested ZIP named
+        # '../x.zip' or '/x.zip' cannot be extracted outside the output directory
+        name = os.path.splitdrive(name.replace('/', os.sep))[1]
+        parts = [part for part in name.split(os.sep) if part not in ('', os.curdir, os.pardir)]
+        return os.path.join(directory, *parts)
+
+    def _extract_nested_zip(self, file, directory, slots):
+        try:
+            with file:
+                self._extract_zip(file, directory, slots)
+        finally:
+            slots.release()
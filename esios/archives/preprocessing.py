@@ -1,7 +1,20 @@
+from functools import lru_cache
 from pathlib import Path
 import pandas as pd
 
 
+@lru_cache(maxsize=32)
+def _period_index(date, periods, freq):
+    """
+    Return the timestamps of consecutive periods starting at local midnight.
+
+    Every sheet of a book shares the same date, so the index is memoized.
+    """
+
+    date_ = pd.Timestamp(date).tz_localize("Europe/Madrid")
+    return pd.date_range(start=date_, periods=periods, freq=freq)
+
+
 def process_excel_file(path, sheet_name):
     """
     Process an Excel file and return a melted dataframe.
@@ -10,22 +23,21 @@ def process_excel_file(path, sheet_name):
     if not isinstance(path, Path):
         path = Path(path)
 
-    sheet_data = pd.read_excel(path, sheet_name=sheet_name, skiprows=0, nrows=1)
-    position = sheet_data.columns.get_loc("Indicadores")
+    # Open the workbook once and read both the header row and the data from it
+    with pd.ExcelFile(path) as book:
+        sheet_data = book.parse(sheet_name=sheet_name, skiprows=0, nrows=1)
+        position = sheet_data.columns.get_loc("Indicadores")
 
-    df = pd.read_excel(
-        path, sheet_name=sheet_name, index_col=list(range(position)), skiprows=2
-    ).iloc[:, 2:]
+        df = book.parse(
+            sheet_name=sheet_name, index_col=list(range(position)), skiprows=2
+        ).iloc[:, 2:]
 
     date = path.stem.split("_")[1]
 
-    if df.shape[1] > 30:
-        date_ = pd.to_datetime(date).tz_localize("Europe/Madrid")
-        date_range = pd.date_range(start=date_, periods=df.shape[1], freq="15min")
-        df.columns = date_range
-    else:
-        hour = df.columns.str.split("-", expand=True).get_level_values(0)
-        df.columns = pd.to_datetime(date + " " + hour).tz_localize("Europe/Madrid")
+    # Columns are consecutive periods from local midnight: quarter-hours when
+    # there are more than 30 of them, hours ("00-01", "01-02", ...) otherwise
+    freq = "15min" if df.shape[1] > 30 else "h"
+    df.columns = _period_index(date, df.shape[1], freq)
 
     df = df.melt(ignore_index=False, var_name="datetime").reset_index()
 
@@ -1,10 +1,28 @@
 import os
+import random
 import requests
 import warnings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .indicators import Indicators
 from .archives import Archives
 from .offer_indicators import OfferIndicators
 
+class _JitteredRetry(Retry):
+    """
+    Retry policy with full jitter, so concurrent clients hitting a rate limit
+    do not retry in lockstep.
+    """
+
+    def get_backoff_time(self):
+        return random.uniform(0, super().get_backoff_time())
+
 class ESIOSClient:
     def __init__(self, api_key_esios=None, api_key_premium=None):
         self.public_base_url = 'https://api.esios.ree.es'
@@ -29,7 +47,12 @@ class ESIOSClient:
             'Authorization': f'Bearer {self.api_key_premium}'
         }
         
+        # Keep enough warm connections for chunked and concurrent requests
         self.session = requests.Session()
+        retries = _JitteredRetry(total=3, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+        self.session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries))
+        
+        self._endpoints = {}
         
     def _get(self, endpoint, headers, params=None):
         url = self._construct_url(endpoint)
@@ -37,6 +60,10 @@ class ESIOSClient:
         try:
             response = self.session.get(url, headers=headers, params=params)
             response.raise_for_status()
+
+            # orjson parses large indicator payloads several times faster
+            if orjson is not None:
+                return orjson.loads(response.content)
             return response.json()
         except requests.exceptions.HTTPError as http_err:
             warnings.warn(f"HTTP error occurred: {http_err}")
@@ -47,11 +74,15 @@ class ESIOSClient:
         return f"{self.public_base_url}/{endpoint}"
     
     def endpoint(self, name):
-        if name == 'indicators':
-            return Indicators(self)
-        elif name == 'archives':
-            return Archives(self)
-        elif name == 'offer_indicators':
-            return OfferIndicators(self)
-        else:
-            raise ValueError(f"Unknown endpoint: {name}")
+        # Reuse managers so their in-memory metadata caches persist across calls
+        if name not in self._endpoints:
+            if name == 'indicators':
+                self._endpoints[name] = Indicators(self)
+            elif name == 'archives':
+                self._endpoints[name] = Archives(self)
+            elif name == 'offer_indicators':
+                self._endpoints[name] = OfferIndicators(self)
+            else:
+                raise ValueError(f"Unknown endpoint: {name}")
+        
+        return self._endpoints[name]
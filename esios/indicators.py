@@ -1,32 +1,41 @@
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from .utils import html_to_text
 
 class Indicators:
     def __init__(self, client):
         self.client = client
+        self._metadata = {}
+        self._catalog = None
 
     def _html_to_text(self, html):
-        soup = BeautifulSoup(html, 'html.parser')
-        return '\n\n'.join([p.get_text() for p in soup.find_all('p')])
+        return html_to_text(html)
 
     def list(self):
-        endpoint = "indicators"
-        data = self.client._get(endpoint, self.client.public_headers)
+        # The catalog rarely changes, so build it once and hand out copies
+        if self._catalog is None:
+            endpoint = "indicators"
+            data = self.client._get(endpoint, self.client.public_headers)
+            
+            indicators = data.get('indicators', [])
+            for indicator in indicators:
+                indicator['description'] = self._html_to_text(indicator['description'])
+            self._catalog = pd.DataFrame(indicators)
         
-        indicators = data.get('indicators', [])
-        for indicator in indicators:
-            indicator['description'] = self._html_to_text(indicator['description'])
-        return pd.DataFrame(indicators)
+        return self._catalog.copy()
 
     def select(self, id):
-        return Indicator(self.client, id)
+        # Indicator metadata rarely changes, so fetch it once per id
+        indicator = Indicator(self.client, id, metadata=self._metadata.get(id))
+        self._metadata[id] = indicator.metadata
+        return indicator
 
 class Indicator:
-    def __init__(self, client, id):
+    def __init__(self, client, id, metadata=None):
         self.client = client
         self.id = id
-        self.metadata = self._get_metadata()
+        self.metadata = metadata if metadata is not None else self._get_metadata()
 
     def _get_metadata(self):
         endpoint = f"indicators/{self.id}"
@@ -48,52 +57,63 @@ class Indicator:
         # Remove None values from params
         params = {k: v for k, v in params.items() if v is not None}
         
-        start_date = pd.to_datetime(start)
-        end_date = pd.to_datetime(end)
+        start_date = pd.Timestamp(start)
+        end_date = pd.Timestamp(end)
         three_weeks = timedelta(weeks=3)
         
-        endpoint = f"indicators/{self.id}"
-        
         if end_date - start_date <= three_weeks:
-            data = self.client._get(endpoint, self.client.public_headers, params=params)
-            data = data.get('indicator', {}).get('values', [])
+            data = self._get_values(params)
             
-            return self._to_dataframe(data, column_name)
+            return self._rename_value(self._to_dataframe(data), column_name)
         
-        data_all = []
+        # Compute every chunk boundary up front instead of once per iteration
+        chunk_starts = pd.date_range(start_date, end_date, freq=three_weeks + timedelta(days=1))
+        chunk_starts = chunk_starts[chunk_starts < end_date]
+        chunk_ends = chunk_starts + three_weeks
+        chunk_ends = chunk_ends.where(chunk_ends < end_date, end_date)
 
-        current_start = start_date
-        while current_start < end_date:
-            current_end = min(current_start + three_weeks, end_date)
-            chunk_params = params.copy()
-            chunk_params['start_date'] = current_start.strftime('%Y-%m-%d')
-            chunk_params['end_date'] = current_end.strftime('%Y-%m-%d') + 'T23:59:59'
+        chunk_params = [
+            {**params, 'start_date': chunk_start, 'end_date': chunk_end + 'T23:59:59'}
+            for chunk_start, chunk_end in zip(chunk_starts.strftime('%Y-%m-%d'), chunk_ends.strftime('%Y-%m-%d'))
+        ]
 
-            data = self.client._get(endpoint, self.client.public_headers, params=chunk_params)
-            data_all.extend(data.get('indicator', {}).get('values', []))
+        # Chunks are independent requests, so overlap their round-trips and
+        # convert each one as it arrives so its raw records can be released
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            frames = [self._to_dataframe(values) for values in executor.map(self._get_values, chunk_params)]
 
-            current_start = current_end + timedelta(days=1)
+        frames = [df for df in frames if not df.empty]
+        df = pd.concat(frames) if frames else pd.DataFrame()
+        
+        return self._rename_value(df, column_name)
 
-        return self._to_dataframe(data_all, column_name)
+    def _get_values(self, params):
+        endpoint = f"indicators/{self.id}"
+        data = self.client._get(endpoint, self.client.public_headers, params=params)
+        return data.get('indicator', {}).get('values', [])
 
-    def _to_dataframe(self, data, column_name='value'):
+    def _to_dataframe(self, data):
         if data:
-            df = pd.DataFrame(data)
+            # Let pandas read only the wanted keys, skipping the time fields that are dropped anyway
+            columns = [col for col in data[0] if col == 'datetime' or 'time' not in col]
+            df = pd.DataFrame.from_records(data, columns=columns)
             if 'datetime' in df.columns:
                 df['datetime'] = pd.to_datetime(df['datetime'], utc=True)
                 df = df.set_index('datetime')
                 df.index = df.index.tz_convert('Europe/Madrid')
             
-            df = df[[col for col in df.columns if 'time' not in col]]
-            
-            if column_name in self.metadata and column_name != 'value':
-                column_name = str(self.metadata[column_name])
-                df.rename(columns={'value': column_name}, inplace=True)
-            
             return df
         else:
             return pd.DataFrame()
 
+    def _rename_value(self, df, column_name):
+        # Relabel the value column once on the final frame, without rename()'s copy
+        if column_name in self.metadata and column_name != 'value':
+            label = str(self.metadata[column_name])
+            df.columns = [label if col == 'value' else col for col in df.columns]
+        
+        return df
+
     def forecast(self):
         # Implement forecast functionality similar to historical
         pass
@@ -1,33 +1,41 @@
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from .utils import html_to_text
 
 class OfferIndicators:
     def __init__(self, client):
         self.client = client
+        self._metadata = {}
+        self._catalog = None
 
     def _html_to_text(self, html):
-        soup = BeautifulSoup(html, 'html.parser')
-        return '\n\n'.join([p.get_text() for p in soup.find_all('p')])
+        return html_to_text(html)
 
     def list(self):
-        endpoint = "offer_indicators"
-        data = self.client._get(endpoint, self.client.public_headers)
-        
-        indicators = data.get('indicators', [])
-        for indicator in indicators:
-            indicator['description'] = self._html_to_text(indicator['description'])
+        # The catalog rarely changes, so build it once and hand out copies
+        if self._catalog is None:
+            endpoint = "offer_indicators"
+            data = self.client._get(endpoint, self.client.public_headers)
             
-        return pd.DataFrame(indicators)
+            indicators = data.get('indicators', [])
+            for indicator in indicators:
+                indicator['description'] = self._html_to_text(indicator['description'])
+            self._catalog = pd.DataFrame(indicators)
+        
+        return self._catalog.copy()
 
     def select(self, id):
-        return OfferIndicator(self.client, id)
+        # Indicator metadata rarely changes, so fetch it once per id
+        indicator = OfferIndicator(self.client, id, metadata=self._metadata.get(id))
+        self._metadata[id] = indicator.metadata
+        return indicator
 
 class OfferIndicator:
-    def __init__(self, client, id):
+    def __init__(self, client, id, metadata=None):
         self.client = client
         self.id = id
-        self.metadata = self._get_metadata()
+        self.metadata = metadata if metadata is not None else self._get_metadata()
 
     def _get_metadata(self):
         endpoint = f"offer_indicators/{self.id}"
@@ -49,33 +57,40 @@ class OfferIndicator:
         end_date = datetime.strptime(end, '%Y-%m-%d')
         three_weeks = timedelta(days=3)
 
-        data_all = []
+        # Compute every chunk boundary up front instead of once per iteration
+        chunk_starts = pd.date_range(start_date, end_date, freq=three_weeks + timedelta(days=1))
+        chunk_starts = chunk_starts[chunk_starts < end_date]
+        chunk_ends = chunk_starts + three_weeks
+        chunk_ends = chunk_ends.where(chunk_ends < end_date, end_date)
 
-        current_start = start_date
-        while current_start < end_date:
-            current_end = min(current_start + three_weeks, end_date)
-            chunk_params = params.copy()
-            chunk_params['start_date'] = current_start.strftime('%Y-%m-%d')
-            chunk_params['end_date'] = current_end.strftime('%Y-%m-%d')
+        chunk_params = [
+            {**params, 'start_date': chunk_start, 'end_date': chunk_end}
+            for chunk_start, chunk_end in zip(chunk_starts.strftime('%Y-%m-%d'), chunk_ends.strftime('%Y-%m-%d'))
+        ]
 
-            endpoint = f"offer_indicators/{self.id}"
-            data = self.client._get(endpoint, self.client.public_headers, params=chunk_params)
-            data_all.extend(data.get('indicator', {}).get('values', []))
+        # Chunks are independent requests, so overlap their round-trips and
+        # convert each one as it arrives so its raw records can be released
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            frames = [self._to_dataframe(values) for values in executor.map(self._get_values, chunk_params)]
 
-            current_start = current_end + timedelta(days=1)
+        frames = [df for df in frames if not df.empty]
+        return pd.concat(frames) if frames else pd.DataFrame()
 
-        return self._to_dataframe(data_all)
+    def _get_values(self, params):
+        endpoint = f"offer_indicators/{self.id}"
+        data = self.client._get(endpoint, self.client.public_headers, params=params)
+        return data.get('indicator', {}).get('values', [])
 
     def _to_dataframe(self, data):
         if data:
-            df = pd.DataFrame(data)
+            # Let pandas read only the wanted keys, skipping the time fields that are dropped anyway
+            columns = [col for col in data[0] if col == 'datetime' or 'time' not in col]
+            df = pd.DataFrame.from_records(data, columns=columns)
             if 'datetime' in df.columns:
                 df['datetime'] = pd.to_datetime(df['datetime'], utc=True)
                 df = df.set_index('datetime')
                 df.index = df.index.tz_convert('Europe/Madrid')
             
-            df = df[[col for col in df.columns if 'time' not in col]]
-            
             return df
         else:
             return pd.DataFrame()
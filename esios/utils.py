@@ -0,0 +1,12 @@
+from functools import lru_cache
+from bs4 import BeautifulSoup
+
+@lru_cache(maxsize=2048)
+def html_to_text(html):
+    """
+    Extract the paragraphs of an HTML description as plain text.
+    
+    Many indicators share the same description, so results are memoized.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    return '\n\n'.join(p.get_text() for p in soup.find_all('p'))